@@ -9,13 +9,85 @@
 """
 
 import csv
+import datetime as dt
+import errno
+import fnmatch
+import os
+import re
+import sys
+from functools import lru_cache
 from os import error
-from os import chdir as Change_Directory
 from loguru import logger
 from pathlib import Path
 import shutil as _shutil
+import stat
 from shutil import SpecialFileError
-from cfsiv_utils.time_strings import timefstring
+
+# characters removed from filenames by clean_filename_str().
+_INVALID_FILENAME_CHARS = r"\/:*?<>|-"
+_INVALID_FILENAME_TABLE = str.maketrans("", "", _INVALID_FILENAME_CHARS)
+
+# Windows (NTFS) and macOS (APFS/HFS+) treat 'README.MD' and 'readme.md' as the same file.
+_CASE_INSENSITIVE_FS = os.path.normcase("A") == "a" or sys.platform == "darwin"
+
+
+# attempts _copy_open_file() makes to create a destination before giving up.
+_MAX_CREATE_ATTEMPTS = 100
+
+
+def _name_key(name: str):
+    """Key for comparing file names the way the filesystem does."""
+    return os.path.normcase(name).casefold() if _CASE_INSENSITIVE_FS else name
+
+
+# absolute paths of directories already created (or found) by _ensure_dir() during this run.
+_KNOWN_DIRS: set = set()
+
+
+def _ensure_dir(directory: Path, verify=False):
+    """Create directory (and parents) once per run, later calls are a set lookup.
+    With verify the cached answer is confirmed with one isdir() check, for callers
+    that hand the directory back to code expecting it to exist.
+    """
+    key = os.path.abspath(directory)  # relative paths depend on the working directory.
+    if key in _KNOWN_DIRS and (not verify or os.path.isdir(key)):
+        return
+    _mkdir_p_fast(directory)
+    _KNOWN_DIRS.add(key)
+
+
+def _create_in_known_dir(directory: Path, create):
+    """Call create() for a file inside directory. If the directory was removed
+    after _ensure_dir() cached it, forget it, make it again and retry once.
+    """
+    try:
+        return create()
+    except FileNotFoundError:
+        key = os.path.abspath(directory)
+        if key not in _KNOWN_DIRS:
+            raise
+        logger.debug(f"Directory vanished, creating it again: {directory}")
+        _KNOWN_DIRS.discard(key)
+        _ensure_dir(directory)
+        return create()
+
+
+def _mkdir_p_fast(directory: Path):
+    """Same result as mkdir(parents=True, exist_ok=True) but works bottom-up,
+    so an existing directory costs a single failed mkdir instead of a walk over its parents.
+    """
+    try:
+        os.mkdir(directory)
+    except FileNotFoundError:
+        if directory.parent == directory:
+            raise  # e.g. a drive that does not exist.
+        _mkdir_p_fast(directory.parent)
+        _mkdir_p_fast(directory)
+    except OSError:
+        # like os.makedirs: EACCES/EROFS may be reported ahead of EEXIST,
+        # e.g. for a drive root or a directory on a read-only mount.
+        if not os.path.isdir(directory):
+            raise
 
 
 @logger.catch
@@ -35,33 +107,35 @@ def write_csv(data, filename="temp.csv", directory="CSV_DATA", use_subs=False):
     """
     # create csv file path
     dirobj = Path(Path.cwd(), directory)
-    dirobj.mkdir(parents=True, exist_ok=True)
-    pathobj = check_and_validate_fname(filename, dirobj)
-
-    if not pathobj.exists():
-        with open(pathobj, "w", newline="") as csvfile:
-            csv_obj = csv.writer(csvfile, delimiter=",")
-            headers = data[0].keys()
-            csv_obj.writerow(headers)
-    with open(pathobj, "a+", newline="") as csvfile:
-        csv_obj = csv.writer(csvfile, delimiter=",")
-        for (
-            item
-        ) in data:  # data should be the list of dicts contaning observations/forecasts.
-            csv_obj.writerow(item.values())
+    _ensure_dir(dirobj)
+    pathobj = _validated_path(filename, dirobj)
+
+    csvfile = _create_in_known_dir(
+        dirobj, lambda: open(pathobj, "a+", newline="")
+    )
+    with csvfile:
+        # data should be the list of dicts contaning observations/forecasts.
+        csv_obj = csv.DictWriter(
+            csvfile, fieldnames=list(data[0].keys()), delimiter=","
+        )
+        if csvfile.tell() == 0:  # new (empty) file, start with the headers.
+            csv_obj.writeheader()
+        csv_obj.writerows(data)
     return
 
 
 @logger.catch
-def get_files(source_directory: Path, pattern=None):
+def get_files(source_directory: Path, pattern=None, excluded_dirs=None):
     """Returns a list of all files from directory matching optional pattern.
 
     Args:
         source_directory (Path): Relative or absolute reference to a directory.
         pattern (str, optional): Filename matching pattern wildcards accepted. Defaults to '*.*'.
+        excluded_dirs (set, optional): Directory names that are not searched, e.g. {'.git'}.
 
     Raises:
         TypeError: If optional inputs are out of bounds.
+        FileNotFoundError: If source_directory is not an accessible directory.
 
     Returns:
         list: A list of all files matching pattern from directory.
@@ -69,37 +143,26 @@ def get_files(source_directory: Path, pattern=None):
     if pattern == None:
         pattern = "*.*"
     else:
-        if type(pattern) != str:
+        if not isinstance(pattern, str):
             raise TypeError(f"pattern must be type string, got {type(pattern)}")
-    if type(source_directory) != Path:
+    if not isinstance(source_directory, Path):
         logger.debug(
             f"source_directory must be type Path. Got: {type(source_directory)}"
         )
         source_directory = Path(source_directory)
-    ORIGINAL_WORKING_DIRECTORY = Path.cwd()
     SOURCE_DIRECTORY = source_directory.resolve()
-    if not (SOURCE_DIRECTORY.is_dir()):
+    if not os.path.isdir(SOURCE_DIRECTORY):
         logger.error(f"Source_directory must be a valid dir. Got {source_directory}")
-    NEW_WORKING_DIRECTORY = Path.cwd()
-    if SOURCE_DIRECTORY != ORIGINAL_WORKING_DIRECTORY:
-        try:
-            Change_Directory(SOURCE_DIRECTORY)
-            NEW_WORKING_DIRECTORY = Path.cwd()
-        except error as e:
-            logger.error(f"Could not access source directory: {e}")
-    if SOURCE_DIRECTORY != NEW_WORKING_DIRECTORY:
-        logger.error("Unknown change directory to source error.")
         raise FileNotFoundError(f"Could not access source_Path: {source_directory}")
-    try:
-        files = list(SOURCE_DIRECTORY.rglob(pattern))
-    except error as e:
-        logger.error(f"Error locating files matching pattern: {pattern}")
-        files = []
-    # TODO return cwd to original location.
-    try:
-        Change_Directory(ORIGINAL_WORKING_DIRECTORY)
-    except error as e:
-        logger.error(f"Could not restore original directory: {e}")
+    # compile the pattern once, fnmatch compares case-insensitively on Windows.
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    regex = re.compile(fnmatch.translate(pattern), flags)
+    files = []
+    # os.walk is built on os.scandir, pruning dirs in place skips whole subtrees.
+    for root, dirs, names in os.walk(SOURCE_DIRECTORY):
+        if excluded_dirs:
+            dirs[:] = [d for d in dirs if d not in excluded_dirs]
+        files.extend(Path(root, name) for name in names if regex.match(name))
     return files
 
 
@@ -109,7 +172,13 @@ def clean_filename_str(fn: str):
     Note: '-' is invalid in windows if it is the last character in a name following a space character.
     # TODO replace invalid characters with underscores.
     """
-    return Path("".join(i for i in fn if i not in "\/:*?<>|-"))
+    return _clean_filename(str(fn))
+
+
+@lru_cache(maxsize=2048)
+def _clean_filename(fn: str):
+    # cached worker for clean_filename_str(), the same names are cleaned repeatedly.
+    return Path(fn.translate(_INVALID_FILENAME_TABLE))
 
 
 @logger.catch
@@ -124,14 +193,28 @@ def new_name_if_exists(file: Path):
     Returns:
         Path_obj: Guaranteed unique filename.
     """
+    return _unused_name(file)
+
+
+def _unused_name(file: Path, taken=()):
+    """Worker for new_name_if_exists(), names in taken are treated as existing too."""
+    taken_keys = {_name_key(name) for name in taken}
+    if _name_key(file.name) not in taken_keys and not os.path.lexists(file):
+        return file  # the usual case, a single lookup and no directory read.
+    try:
+        # collision: read the directory once and resolve further ones in memory.
+        with os.scandir(file.parent) as entries:
+            existing = {_name_key(entry.name) for entry in entries}
+    except FileNotFoundError:
+        existing = set()  # nothing on disk can collide in a missing directory.
+    existing.update(taken_keys)
     new_name = file
     i = 1
     while True:
-        if not new_name.is_file():
+        if _name_key(new_name.name) not in existing:
             return new_name
-        else:
-            new_name = file.with_name(f"{file.stem}({i}){file.suffix}")
-            i += 1
+        new_name = file.with_name(f"{file.stem}({i}){file.suffix}")
+        i += 1
 
 
 @logger.catch
@@ -150,34 +233,123 @@ def copy_to_target(file: Path, target_diectory=None):
     if target_diectory == None:
         target_diectory = Path.cwd()
     else:
-        if type(target_diectory) != Path:
-            raise FileNotFoundError(
-                f"target_directory must be type Path, got {type(target_diectory)}"
+        if not isinstance(target_diectory, Path):
+            logger.debug(
+                f"target_directory should be type Path, got {type(target_diectory)}"
             )
-    new_file = new_name_if_exists(target_diectory / file.name)
+            target_diectory = Path(target_diectory)
     try:
-        _shutil.copy2(file, new_file)
+        with open(file, "rb") as src:
+            _copy_open_file(src, os.fstat(src.fileno()), target_diectory / file.name)
     except error as e:
         raise SpecialFileError(f"could not copy file '{file}' due to: {e}")
     return True
 
 
+def _fast_copy(src_fd, dst_fd, size):
+    """Copy size bytes from src_fd to dst_fd, keeping the data inside the kernel when possible.
+    Tries os.copy_file_range, then os.sendfile, then falls back to shutil.copyfileobj.
+    """
+    kernel_copies = []
+    if hasattr(os, "copy_file_range"):
+        kernel_copies.append(
+            lambda offset, count: os.copy_file_range(src_fd, dst_fd, count, offset)
+        )
+    if hasattr(os, "sendfile"):
+        kernel_copies.append(
+            lambda offset, count: os.sendfile(dst_fd, src_fd, offset, count)
+        )
+    copied = 0
+    for kernel_copy in kernel_copies:
+        try:
+            while copied < size:
+                sent = kernel_copy(copied, size - copied)
+                if sent == 0:
+                    # copy_file_range reports 0 for procfs/sysfs and some FUSE or
+                    # cross-fs setups, leave the rest to the next method.
+                    break
+                copied += sent
+        except OSError as e:
+            logger.debug(f"Kernel copy unavailable, trying next method: {e}")
+        if copied >= size:
+            return
+    os.lseek(src_fd, copied, os.SEEK_SET)
+    with open(src_fd, "rb", closefd=False) as src, open(
+        dst_fd, "wb", closefd=False
+    ) as dst:
+        _shutil.copyfileobj(src, dst)
+    written = os.lseek(dst_fd, 0, os.SEEK_CUR)
+    if written < size:
+        raise OSError(errno.EIO, f"short copy, wrote {written} of {size} bytes")
+
+
+def _copy_open_file(src, src_stat, new_file: Path):
+    """Copy an already opened source file to an unused name based on new_file
+    and carry over its mode and times. Reusing the caller's fstat() result avoids
+    another lookup of the source path.
+
+    Returns:
+        Path: the name actually written.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    refused = set()
+    unique_file = new_file
+    for _ in range(_MAX_CREATE_ATTEMPTS):
+        try:
+            # O_EXCL refuses an existing name, so the free case needs no lookup first.
+            dst_fd = _create_in_known_dir(
+                unique_file.parent, lambda: os.open(unique_file, flags, 0o644)
+            )
+            break
+        except FileExistsError:
+            # taken, possibly under another spelling the filesystem treats as equal.
+            refused.add(unique_file.name)
+            unique_file = _unused_name(new_file, refused)
+    else:
+        raise FileExistsError(f"could not create an unused name for '{new_file}'")
+    try:
+        _fast_copy(src.fileno(), dst_fd, src_stat.st_size)
+    except BaseException:
+        os.close(dst_fd)
+        os.unlink(unique_file)  # do not leave a partial copy behind.
+        raise
+    try:
+        target = dst_fd if os.chmod in os.supports_fd else unique_file
+        os.chmod(target, stat.S_IMODE(src_stat.st_mode))
+        target = dst_fd if os.utime in os.supports_fd else unique_file
+        os.utime(target, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+    finally:
+        os.close(dst_fd)
+    return unique_file
+
+
+@lru_cache(maxsize=256)
+def _year_month(mtime_sec: int):
+    """Local (year, month) of a timestamp, cached since batches of files share timestamps."""
+    date = dt.datetime.fromtimestamp(mtime_sec)
+    return date.year, date.month
+
+
 @logger.catch
-def create_timestamp_subdirectory_Structure(file: Path, target_directory=None):
+def create_timestamp_subdirectory_Structure(
+    file: Path, target_directory=None, creation_date=None
+):
     if target_directory == None:
         target_directory = Path.cwd()
     else:
-        if type(target_directory) != Path:
-            raise TypeError(
-                f"target directory must be a valid Path, got {type(target_directory)}"
+        if not isinstance(target_directory, Path):
+            logger.debug(
+                f"target directory should be a valid Path, got {type(target_directory)}"
             )
-    creation_date = (
-        file.stat().st_mtime
-    )  # in windows this is closer to the oldest date on the file.
-    # st_ctime will be equal to the most recent time the file was copied from place to place.
-    date = timefstring(creation_date)
-    new_path = target_directory / f"{date.year}/{date.month:02}/"
-    new_path.mkdir(parents=True, exist_ok=True)
+            target_directory = Path(target_directory)
+    if creation_date == None:
+        creation_date = (
+            file.stat().st_mtime
+        )  # in windows this is closer to the oldest date on the file.
+        # st_ctime will be equal to the most recent time the file was copied from place to place.
+    year, month = _year_month(int(creation_date))
+    new_path = target_directory / f"{year}/{month:02}/"
+    _ensure_dir(new_path, verify=True)
     return new_path
 
 
@@ -196,14 +368,22 @@ def copy_to_target_and_divide_by_filedate(file: Path, target_directory=None):
     if target_directory == None:
         target_directory = Path.cwd()
     else:
-        if type(target_directory) != Path:
-            raise TypeError(
-                f"target directory must be a valid Path, got {type(target_directory)}"
+        if not isinstance(target_directory, Path):
+            logger.debug(
+                f"target directory should be a valid Path, got {type(target_directory)}"
             )
-    new_path = create_timestamp_subdirectory_Structure(
-        file, target_directory=target_directory
-    )
-    return copy_to_target(file.name, new_path)
+            target_directory = Path(target_directory)
+    try:
+        # open the source once and take every needed detail from a single fstat().
+        with open(file, "rb") as src:
+            src_stat = os.fstat(src.fileno())
+            new_path = create_timestamp_subdirectory_Structure(
+                file, target_directory=target_directory, creation_date=src_stat.st_mtime
+            )
+            _copy_open_file(src, src_stat, new_path / file.name)
+    except error as e:
+        raise SpecialFileError(f"could not copy file '{file}' due to: {e}")
+    return True
 
 
 @logger.catch
@@ -224,22 +404,25 @@ def copy_to_target_and_divide_by_dictionary(
     if characters == None:
         characters = 1  # defaults to the first character of the filename.
     else:
-        if type(characters) != int:
-            raise (f"characters value must be integer, got {type(characters)}")
+        if not isinstance(characters, int):
+            raise TypeError(
+                f"characters value must be integer, got {type(characters)}"
+            )
     if target_directory == None:
         target_directory = Path.cwd()  # defaults to the current working directory.
     else:
-        if type(target_directory) != Path:
-            raise TypeError(
-                f"target directory must be a valid Path, got {type(target_directory)}"
+        if not isinstance(target_directory, Path):
+            logger.debug(
+                f"target directory should be a valid Path, got {type(target_directory)}"
             )
+            target_directory = Path(target_directory)
     new_path = target_directory / f"{file.name[0:characters]}/"
-    new_path.mkdir(parents=True, exist_ok=True)
-    return copy_to_target(file.name, new_path)
+    _ensure_dir(new_path)
+    return copy_to_target(file, new_path)
 
 
 @logger.catch
-def check_and_validate_fname(fname, target_directory=None):
+def check_and_validate_fname(fname, target_directory=None, rename=False):
     """Remove invalid characters in filename, combine with target_directory (optional)
     and optionaly create a new filename that doesn't already exist at destination.
 
@@ -249,18 +432,28 @@ def check_and_validate_fname(fname, target_directory=None):
         rename (bool, optional): generates a name that is unique. Defaults to False.
 
     Returns:
-        Path: Path object that is valid.
+        Path: Path object that is valid, and does not exist when rename is True.
     """
     if target_directory == None:
         target_directory = Path.cwd()  # defaults to the current working directory.
     else:
-        if type(target_directory) != Path:
+        if not isinstance(target_directory, Path):
             logger.debug(
-                f"target directory must be a valid Path, got {type(target_directory)}"
+                f"target directory should be a valid Path, got {type(target_directory)}"
             )
-    clean_name = clean_filename_str(fname)
-    target_directory.mkdir(parents=True, exist_ok=True)
-    return Path(target_directory, clean_name)
+            target_directory = Path(target_directory)
+    if not isinstance(rename, bool):
+        raise TypeError(f"rename must be Bool, got {type(rename)}")
+    pathobj = _validated_path(fname, target_directory)
+    _ensure_dir(target_directory, verify=True)
+    if not rename:
+        return pathobj
+    return new_name_if_exists(pathobj)
+
+
+def _validated_path(fname, target_directory: Path):
+    """Combine target_directory with a cleaned fname, without touching the filesystem."""
+    return Path(target_directory, clean_filename_str(fname))
 
 
 @logger.catch
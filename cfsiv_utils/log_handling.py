@@ -6,9 +6,54 @@
 import os
 import tqdm
 import datetime as dt
+from pathlib import Path
 from loguru import logger
 
 
+class Rotator:
+    # Custom rotation handler that combines filesize limits with time controlled rotation.
+
+    def __init__(self, *, size, at):
+        now = dt.datetime.now()
+
+        self._size_limit = size
+        self._time_limit = now.replace(
+            hour=at.hour, minute=at.minute, second=at.second
+        )
+
+        if now >= self._time_limit:
+            # The current time is already past the target time so it would rotate already.
+            # Add one day to prevent an immediate rotation.
+            self._time_limit += dt.timedelta(days=1)
+        # timezone aware copy, compared directly with loguru's aware record times.
+        self._time_limit_aware = self._time_limit.astimezone()
+
+        # running size of the current logfile, measured once then tracked per message.
+        self._bytes_written = None
+
+    def should_rotate(self, message, file):
+        if self._bytes_written is None:
+            file.seek(0, 2)
+            self._bytes_written = file.tell()
+
+        # the logfile sink is utf8 encoded, count bytes rather than characters.
+        message_size = len(message.encode("utf8"))
+
+        if self._bytes_written + message_size > self._size_limit:
+            # Loguru writes this message as the first entry of the new file.
+            self._bytes_written = message_size
+            return True
+
+        if message.record["time"] > self._time_limit_aware:
+            self._time_limit += dt.timedelta(days=1)
+            self._time_limit_aware = self._time_limit.astimezone()
+            self._bytes_written = message_size
+            return True
+
+        self._bytes_written += message_size
+        return False
+
+
 @logger.catch
 def defineLoggers(filename, CONSOLE="INFO", FILELOG="DEBUG"):
     """Setup standardized basic logging using Loguru module.
@@ -22,34 +67,6 @@ def defineLoggers(filename, CONSOLE="INFO", FILELOG="DEBUG"):
         nothing:
     """
 
-    class Rotator:
-        # Custom rotation handler that combines filesize limits with time controlled rotation.
-
-        def __init__(self, *, size, at):
-            now = dt.datetime.now()
-
-            self._size_limit = size
-            self._time_limit = now.replace(
-                hour=at.hour, minute=at.minute, second=at.second
-            )
-
-            if now >= self._time_limit:
-                # The current time is already past the target time so it would rotate already.
-                # Add one day to prevent an immediate rotation.
-                self._time_limit += dt.timedelta(days=1)
-
-        def should_rotate(self, message, file):
-            file.seek(0, 2)
-
-            if file.tell() + len(message) > self._size_limit:
-                return True
-
-            if message.record["time"].timestamp() > self._time_limit.timestamp():
-                self._time_limit += dt.timedelta(days=1)
-                return True
-
-            return False
-
     # set rotate file if over 500 MB or at midnight every day
     rotator = Rotator(size=5e8, at=dt.time(0, 0, 0))
     # example useage: logger.add("file.log", rotation=rotator.should_rotate)
@@ -65,8 +82,12 @@ def defineLoggers(filename, CONSOLE="INFO", FILELOG="DEBUG"):
     logger.configure(handlers=[{"sink": os.sys.stderr, "level": CONSOLE}])
     # this method automatically suppresses the default handler to modify the message level
 
+    # absolute sink path so rotations do not depend on the working directory later.
+    log_directory = Path.cwd() / "LOGS"
+    log_directory.mkdir(exist_ok=True)
+    sink_path = str(log_directory / f"{filename}_{{time}}.log")
     logger.add(
-        "".join(["./LOGS/", filename, "_{time}.log"]),
+        sink_path,
         rotation=rotator.should_rotate,
         level=FILELOG,
         encoding="utf8",
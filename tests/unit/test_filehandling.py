@@ -1,3 +1,9 @@
+import os
+import errno
+import datetime as dt
+import shutil
+import stat
+import pytest
 from pathlib import Path
 import cfsiv_utils.filehandling as fh
 
@@ -13,3 +19,367 @@ def test_clean_filename_str():
 def test_new_name_if_exists():
     testname = fh.new_name_if_exists(Path('README.md'))
     assert testname == Path('README(1).md')
+
+
+
+def test_clean_filename_str_accepts_path():
+    reslt = fh.clean_filename_str(Path('a-b|c.ext'))
+    assert reslt == Path('abc.ext')
+
+
+
+def test_new_name_if_exists_skips_taken_names(tmp_path):
+    (tmp_path / 'data.csv').touch()
+    (tmp_path / 'data(1).csv').touch()
+    testname = fh.new_name_if_exists(tmp_path / 'data.csv')
+    assert testname == tmp_path / 'data(2).csv'
+    assert fh.new_name_if_exists(tmp_path / 'new.csv') == tmp_path / 'new.csv'
+
+
+
+def test_check_and_validate_fname_creates_directory(tmp_path):
+    target = tmp_path / 'a' / 'b'
+    reslt = fh.check_and_validate_fname('some|name.csv', target)
+    assert reslt == target / 'somename.csv'
+    assert target.is_dir()
+    assert str(target) in fh._KNOWN_DIRS
+
+
+
+def test_copy_to_target_keeps_existing_file(tmp_path, monkeypatch):
+    source = tmp_path / 'source.txt'
+    source.write_text('payload')
+    target = tmp_path / 'target'
+    target.mkdir()
+    (target / 'source.txt').write_text('original')
+    monkeypatch.chdir(target)
+    assert fh.copy_to_target(source)
+    assert (target / 'source.txt').read_text() == 'original'
+    assert (target / 'source(1).txt').read_text() == 'payload'
+    assert (target / 'source(1).txt').stat().st_mtime == source.stat().st_mtime
+
+
+
+def test_get_files(tmp_path):
+    (tmp_path / 'sub' / 'deeper').mkdir(parents=True)
+    (tmp_path / 'top.zip').touch()
+    (tmp_path / 'sub' / 'inner.zip').touch()
+    (tmp_path / 'sub' / 'deeper' / 'deep.zip').touch()
+    (tmp_path / 'sub' / 'notes.txt').touch()
+    cwd = Path.cwd()
+    files = fh.get_files(tmp_path, pattern='*.zip')
+    assert Path.cwd() == cwd
+    assert sorted(f.name for f in files) == ['deep.zip', 'inner.zip', 'top.zip']
+    assert len(fh.get_files(tmp_path)) == 4
+
+
+
+def test_write_csv_appends_after_header(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fh.write_csv([{'a': 1, 'b': 2}], filename='out.csv', directory='csv')
+    fh.write_csv([{'a': 3, 'b': 4}, {'a': 5, 'b': 6}], filename='out.csv', directory='csv')
+    lines = (tmp_path / 'csv' / 'out.csv').read_text().splitlines()
+    assert lines == ['a,b', '1,2', '3,4', '5,6']
+
+
+
+def test_mkdir_p_fast(tmp_path):
+    target = tmp_path / 'x' / 'y' / 'z'
+    fh._mkdir_p_fast(target)
+    assert target.is_dir()
+    fh._mkdir_p_fast(target)  # existing directory is not an error.
+    (tmp_path / 'file').touch()
+    with pytest.raises(FileExistsError):
+        fh._mkdir_p_fast(tmp_path / 'file')
+
+
+
+def test_copy_to_target_and_divide_by_filedate(tmp_path):
+    source = tmp_path / 'source.txt'
+    source.write_text('payload')
+    os.utime(source, (1600000000, 1600000000))  # 2020-09-13
+    target = tmp_path / 'sorted'
+    assert fh.copy_to_target_and_divide_by_filedate(source, target)
+    month = dt.datetime.fromtimestamp(1600000000)
+    copied = target / f'{month.year}' / f'{month.month:02}' / 'source.txt'
+    assert copied.read_text() == 'payload'
+    assert copied.stat().st_mtime == source.stat().st_mtime
+
+
+
+def test_target_directory_accepts_str(tmp_path):
+    reslt = fh.check_and_validate_fname('name.csv', str(tmp_path))
+    assert reslt == tmp_path / 'name.csv'
+
+
+
+def test_check_and_validate_fname_rename(tmp_path):
+    (tmp_path / 'name.csv').touch()
+    assert fh.check_and_validate_fname('name.csv', tmp_path) == tmp_path / 'name.csv'
+    reslt = fh.check_and_validate_fname('name.csv', tmp_path, rename=True)
+    assert reslt == tmp_path / 'name(1).csv'
+
+
+
+def test_write_csv_matches_columns_by_key(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fh.write_csv([{'a': 1, 'b': 2}, {'b': 4, 'a': 3}], filename='out.csv', directory='csv')
+    lines = (tmp_path / 'csv' / 'out.csv').read_text().splitlines()
+    assert lines == ['a,b', '1,2', '3,4']
+
+
+
+def test_copy_to_target_and_divide_by_dictionary(tmp_path):
+    source = tmp_path / 'source' / 'report.txt'
+    source.parent.mkdir()
+    source.write_text('payload')
+    target = tmp_path / 'sorted'
+    assert fh.copy_to_target_and_divide_by_dictionary(source, target, characters=2)
+    assert (target / 're' / 'report.txt').read_text() == 'payload'
+
+
+
+def test_get_files_excluded_dirs(tmp_path):
+    (tmp_path / '.git').mkdir()
+    (tmp_path / '.git' / 'pack.zip').touch()
+    (tmp_path / 'keep.zip').touch()
+    files = fh.get_files(tmp_path, pattern='*.zip', excluded_dirs={'.git'})
+    assert files == [tmp_path / 'keep.zip']
+
+
+
+def test_new_name_if_exists_case_insensitive(tmp_path, monkeypatch):
+    monkeypatch.setattr(fh, '_CASE_INSENSITIVE_FS', True)
+    real_lexists = os.path.lexists
+    # lookups on NTFS/APFS match any spelling of the name.
+    monkeypatch.setattr(os.path, 'lexists', lambda p: real_lexists(p) or any(
+        c.name.lower() == Path(p).name.lower() for c in Path(p).parent.iterdir()))
+    (tmp_path / 'readme.md').touch()
+    assert fh.new_name_if_exists(tmp_path / 'README.MD') == tmp_path / 'README(1).MD'
+    reslt = fh.check_and_validate_fname('README.MD', tmp_path, rename=True)
+    assert reslt == tmp_path / 'README(1).MD'
+
+
+
+def test_write_csv_recreates_removed_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fh.write_csv([{'a': 1}], filename='out.csv', directory='csv')
+    shutil.rmtree(tmp_path / 'csv')
+    fh.write_csv([{'a': 2}], filename='out.csv', directory='csv')
+    assert (tmp_path / 'csv' / 'out.csv').read_text().splitlines() == ['a', '2']
+
+
+
+def test_copy_recreates_removed_directory(tmp_path):
+    source = tmp_path / 'report.txt'
+    source.write_text('payload')
+    target = tmp_path / 'sorted'
+    assert fh.copy_to_target_and_divide_by_dictionary(source, target)
+    shutil.rmtree(target)
+    assert fh.copy_to_target_and_divide_by_dictionary(source, target)
+    assert (target / 'r' / 'report.txt').read_text() == 'payload'
+
+
+
+def _case_insensitive_open(real_open):
+    # behave like NTFS/APFS: O_EXCL fails when any spelling of the name exists.
+    def fake_open(path, flags, *args):
+        path = Path(path)
+        if flags & os.O_EXCL and path.parent.is_dir():
+            if any(p.name.lower() == path.name.lower() for p in path.parent.iterdir()):
+                raise FileExistsError(path)
+        return real_open(path, flags, *args)
+    return fake_open
+
+
+
+def test_copy_to_target_case_insensitive_collision(tmp_path, monkeypatch):
+    source = tmp_path / 'Data.txt'
+    source.write_text('payload')
+    target = tmp_path / 't'
+    target.mkdir()
+    (target / 'data.txt').write_text('original')
+    monkeypatch.setattr(os, 'open', _case_insensitive_open(os.open))
+    assert fh.copy_to_target(source, target)
+    assert (target / 'data.txt').read_text() == 'original'
+    assert (target / 'Data(1).txt').read_text() == 'payload'
+
+
+
+def test_copy_to_target_gives_up_when_names_are_refused(tmp_path, monkeypatch):
+    source = tmp_path / 'Data.txt'
+    source.write_text('payload')
+    real_open = os.open
+
+    def refusing_open(path, flags, *args):
+        if flags & os.O_EXCL:
+            raise FileExistsError(path)
+        return real_open(path, flags, *args)
+
+    monkeypatch.setattr(os, 'open', refusing_open)
+    assert fh.copy_to_target(source, tmp_path / 'x') is None  # error logged, no hang.
+
+
+
+def _run_fast_copy(tmp_path, size=300000):
+    payload = os.urandom(size)
+    (tmp_path / 'src.bin').write_bytes(payload)
+    src_fd = os.open(tmp_path / 'src.bin', os.O_RDONLY)
+    dst_fd = os.open(tmp_path / 'dst.bin', os.O_WRONLY | os.O_CREAT)
+    try:
+        fh._fast_copy(src_fd, dst_fd, size)
+    finally:
+        os.close(src_fd)
+        os.close(dst_fd)
+    return payload, (tmp_path / 'dst.bin').read_bytes()
+
+
+
+def _exdev(*args):
+    raise OSError(errno.EXDEV, 'Invalid cross-device link')
+
+
+
+def _partial_copy_file_range(real_copy):
+    # copies one small chunk, then refuses like a cross-device copy would.
+    calls = []
+
+    def fake(src_fd, dst_fd, count, offset_src=None):
+        if calls:
+            _exdev()
+        calls.append(count)
+        return real_copy(src_fd, dst_fd, min(count, 4096), offset_src)
+    return fake
+
+
+
+def _partial_sendfile(real_sendfile):
+    calls = []
+
+    def fake(out_fd, in_fd, offset, count):
+        if calls:
+            _exdev()
+        calls.append(count)
+        return real_sendfile(out_fd, in_fd, offset, min(count, 4096))
+    return fake
+
+
+
+@pytest.mark.skipif(not hasattr(os, 'copy_file_range'), reason='needs copy_file_range')
+def test_fast_copy_falls_back_to_sendfile(tmp_path, monkeypatch):
+    monkeypatch.setattr(os, 'copy_file_range', _exdev)
+    payload, copied = _run_fast_copy(tmp_path)
+    assert copied == payload
+
+
+
+@pytest.mark.skipif(not hasattr(os, 'copy_file_range'), reason='needs copy_file_range')
+def test_fast_copy_continues_after_partial_copy_file_range(tmp_path, monkeypatch):
+    monkeypatch.setattr(os, 'copy_file_range', _partial_copy_file_range(os.copy_file_range))
+    monkeypatch.setattr(os, 'sendfile', _partial_sendfile(os.sendfile))
+    payload, copied = _run_fast_copy(tmp_path)
+    assert copied == payload
+
+
+
+def test_fast_copy_falls_back_to_copyfileobj(tmp_path, monkeypatch):
+    monkeypatch.setattr(os, 'copy_file_range', _exdev, raising=False)
+    monkeypatch.setattr(os, 'sendfile', _exdev, raising=False)
+    payload, copied = _run_fast_copy(tmp_path)
+    assert copied == payload
+
+
+
+def test_fast_copy_zero_return_is_not_success(tmp_path, monkeypatch):
+    monkeypatch.setattr(os, 'copy_file_range', lambda *args: 0, raising=False)
+    monkeypatch.setattr(os, 'sendfile', lambda *args: 0, raising=False)
+    payload, copied = _run_fast_copy(tmp_path)
+    assert copied == payload
+
+
+
+def test_fast_copy_reports_short_copy(tmp_path, monkeypatch):
+    monkeypatch.setattr(os, 'copy_file_range', lambda *args: 0, raising=False)
+    monkeypatch.setattr(os, 'sendfile', lambda *args: 0, raising=False)
+    (tmp_path / 'src.bin').write_bytes(b'short')
+    src_fd = os.open(tmp_path / 'src.bin', os.O_RDONLY)
+    dst_fd = os.open(tmp_path / 'dst.bin', os.O_WRONLY | os.O_CREAT)
+    try:
+        with pytest.raises(OSError):
+            fh._fast_copy(src_fd, dst_fd, 100)  # source ends before the expected size.
+    finally:
+        os.close(src_fd)
+        os.close(dst_fd)
+
+
+
+def test_copy_to_target_keeps_permission_bits(tmp_path):
+    source = tmp_path / 'script.sh'
+    source.write_text('payload')
+    source.chmod(0o750)
+    target = tmp_path / 'target'
+    target.mkdir()
+    assert fh.copy_to_target(source, target)
+    assert stat.S_IMODE((target / 'script.sh').stat().st_mode) == stat.S_IMODE(source.stat().st_mode)
+
+
+
+def test_new_name_if_exists_without_collision_skips_scan(tmp_path, monkeypatch):
+    def no_scan(*args):
+        raise AssertionError('directory scanned without a collision')
+    monkeypatch.setattr(os, 'scandir', no_scan)
+    assert fh.new_name_if_exists(tmp_path / 'free.csv') == tmp_path / 'free.csv'
+
+
+
+def test_copy_many_files_into_one_directory(tmp_path, monkeypatch):
+    sources = tmp_path / 'sources'
+    sources.mkdir()
+    for i in range(200):
+        (sources / f'file{i}.txt').write_text(str(i))
+    target = tmp_path / 'target'
+    target.mkdir()
+
+    def no_scan(*args):
+        raise AssertionError('target directory scanned without a collision')
+    monkeypatch.setattr(os, 'scandir', no_scan)
+    for i in range(200):
+        assert fh.copy_to_target(sources / f'file{i}.txt', target)
+    assert len(list(target.iterdir())) == 200
+    assert (target / 'file199.txt').read_text() == '199'
+
+
+
+def test_known_dirs_keyed_on_absolute_path(tmp_path, monkeypatch):
+    (tmp_path / 'one').mkdir()
+    (tmp_path / 'two').mkdir()
+    monkeypatch.chdir(tmp_path / 'one')
+    fh.check_and_validate_fname('x.csv', Path('rel'))
+    monkeypatch.chdir(tmp_path / 'two')
+    reslt = fh.check_and_validate_fname('x.csv', Path('rel'))
+    assert reslt.parent.is_dir()
+    assert (tmp_path / 'two' / 'rel').is_dir()
+
+
+
+def test_public_helpers_recreate_removed_directory(tmp_path):
+    target = tmp_path / 'csv'
+    fh.check_and_validate_fname('x.csv', target)
+    shutil.rmtree(target)
+    assert fh.check_and_validate_fname('x.csv', target).parent.is_dir()
+
+    source = tmp_path / 'source.txt'
+    source.write_text('payload')
+    month_dir = fh.create_timestamp_subdirectory_Structure(source, tmp_path / 'sorted')
+    shutil.rmtree(month_dir)
+    assert fh.create_timestamp_subdirectory_Structure(source, tmp_path / 'sorted').is_dir()
+
+
+
+def test_mkdir_p_fast_existing_directory_reported_as_readonly(tmp_path, monkeypatch):
+    def readonly_mkdir(path, *args):
+        raise OSError(errno.EROFS, 'Read-only file system', str(path))
+    monkeypatch.setattr(os, 'mkdir', readonly_mkdir)
+    fh._mkdir_p_fast(tmp_path)  # exists already, so not an error.
+    with pytest.raises(OSError):
+        fh._mkdir_p_fast(tmp_path / 'missing')
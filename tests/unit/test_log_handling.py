@@ -0,0 +1,58 @@
+import io
+import datetime as dt
+from cfsiv_utils.log_handling import Rotator
+
+
+
+class FakeMessage(str):
+    # loguru hands should_rotate a str carrying the log record.
+    def __new__(cls, text, time):
+        msg = super().__new__(cls, text)
+        msg.record = {'time': time}
+        return msg
+
+
+
+class CountingFile(io.StringIO):
+    seeks = 0
+
+    def seek(self, *args):
+        self.seeks += 1
+        return super().seek(*args)
+
+
+
+def _now():
+    return dt.datetime.now().astimezone()
+
+
+
+def test_rotator_reads_file_size_once():
+    rotator = Rotator(size=1000, at=dt.time(0, 0, 0))
+    logfile = CountingFile('x' * 100)
+    assert not rotator.should_rotate(FakeMessage('a' * 10, _now()), logfile)
+    assert not rotator.should_rotate(FakeMessage('b' * 10, _now()), logfile)
+    assert logfile.seeks == 1
+    assert rotator._bytes_written == 120
+
+
+
+def test_rotator_size_rollover_counts_utf8_bytes():
+    rotator = Rotator(size=30, at=dt.time(0, 0, 0))
+    logfile = io.StringIO()
+    assert not rotator.should_rotate(FakeMessage('é' * 10, _now()), logfile)  # 20 bytes
+    assert rotator.should_rotate(FakeMessage('é' * 10, _now()), logfile)
+    assert rotator._bytes_written == 20  # the new file starts with this message.
+    assert not rotator.should_rotate(FakeMessage('a' * 10, _now()), logfile)
+
+
+
+def test_rotator_time_rollover():
+    rotator = Rotator(size=1000, at=dt.time(0, 0, 0))
+    limit = rotator._time_limit_aware
+    logfile = io.StringIO()
+    before = (limit - dt.timedelta(seconds=1)).astimezone(dt.timezone.utc)
+    assert not rotator.should_rotate(FakeMessage('a', before), logfile)
+    assert rotator.should_rotate(FakeMessage('a', limit + dt.timedelta(seconds=1)), logfile)
+    assert rotator._time_limit_aware > limit + dt.timedelta(hours=22)
+    assert not rotator.should_rotate(FakeMessage('a', limit + dt.timedelta(seconds=2)), logfile)